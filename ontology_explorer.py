@@ -12,11 +12,30 @@ app = marimo.App(width="full")
 @app.cell
 def _():
     import marimo as mo
-    import httpx
     import networkx as nx
     from yfiles_jupyter_graphs import GraphWidget
     from collections import defaultdict
-    return GraphWidget, httpx, mo, nx
+    from src.agentic_graph_middleware.visualization.ontology_loader import (
+        CLASSES_QUERY,
+        RELATIONSHIPS_QUERY,
+        FusekiSPARQLClient,
+        cached_load,
+        clear_cache,
+        get_local_name,
+        get_namespace,
+    )
+    return (
+        CLASSES_QUERY,
+        FusekiSPARQLClient,
+        GraphWidget,
+        RELATIONSHIPS_QUERY,
+        cached_load,
+        clear_cache,
+        get_local_name,
+        get_namespace,
+        mo,
+        nx,
+    )
 
 
 @app.cell
@@ -58,56 +77,13 @@ def _():
 
 
 @app.cell
-def _(DATASET, FUSEKI_URL, PASSWORD, USERNAME, httpx):
-    def query_fuseki(query: str):
-        """Execute SPARQL query"""
-        client = httpx.Client(auth=(USERNAME, PASSWORD), timeout=30.0)
-        endpoint = f"{FUSEKI_URL}/{DATASET}/sparql"
-        response = client.post(
-            endpoint,
-            data={'query': query},
-            headers={'Accept': 'application/sparql-results+json'}
-        )
-        response.raise_for_status()
-        results = response.json()
-        client.close()
-        return results['results']['bindings']
-    return (query_fuseki,)
+def _(DATASET, FUSEKI_URL, FusekiSPARQLClient, PASSWORD, USERNAME):
+    import atexit
 
-
-@app.cell
-def _():
-    def get_namespace(uri: str, local_name: str) -> str:
-        """Determine ontology namespace"""
-        uri_lower = uri.lower()
-        local_lower = local_name.lower()
-
-        if any(x in local_lower for x in ['databusinesscanvas', 'customersegment', 'valueproposition',
-                                            'revenuestream', 'coststructure', 'dataasset', 'intelligencecapability']):
-            return 'dbc'
-        elif 'bridge' in uri_lower or any(x in local_lower for x in ['channel', 'customerrelationship', 'keyresource',
-                                                                       'keyactivity', 'keypartner', 'dataproduct',
-                                                                       'dataservice', 'executivetarget']):
-            return 'bridge'
-        elif 'sow' in uri_lower or 'semanticsowcontract' in local_lower:
-            return 'sow'
-        elif 'gist' in uri_lower and 'bridge' not in uri_lower:
-            return 'gist'
-        elif 'owl' in uri_lower or 'www.w3.org/2002/07/owl' in uri:
-            return 'owl'
-        elif 'rdf' in uri_lower or 'www.w3.org/1999/02/22-rdf-syntax-ns' in uri:
-            return 'rdf'
-        else:
-            return 'unknown'
-
-    def get_local_name(uri: str) -> str:
-        """Extract local name from URI"""
-        if '#' in uri:
-            return uri.split('#')[-1]
-        elif '/' in uri:
-            return uri.split('/')[-1]
-        return uri
-    return get_local_name, get_namespace
+    # One keep-alive client for every SPARQL call instead of a handshake per query
+    fuseki = FusekiSPARQLClient(FUSEKI_URL, DATASET, auth=(USERNAME, PASSWORD))
+    atexit.register(fuseki.close)
+    return (fuseki,)
 
 
 @app.cell
@@ -117,90 +93,95 @@ def _(mo):
 
 
 @app.cell
-def _(ONTOLOGY_COLORS, get_local_name, get_namespace, nx, query_fuseki):
-    # Fetch classes
-    classes_query = """
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-    SELECT DISTINCT ?class ?label ?comment
-    WHERE {
-      ?class a owl:Class .
-      OPTIONAL { ?class rdfs:label ?label }
-      OPTIONAL { ?class rdfs:comment ?comment }
-    }
-    LIMIT 500
-    """
+def _(clear_cache, mo):
+    def _on_refresh(count):
+        clear_cache()
+        return count + 1
 
-    classes = query_fuseki(classes_query)
-
-    # Build NetworkX graph
-    G = nx.DiGraph()
-
-    # Add nodes
-    namespace_counts = {}
-    for cls in classes:
-        uri = cls['class']['value']
-        label = cls.get('label', {}).get('value', get_local_name(uri))
-        comment = cls.get('comment', {}).get('value', '')
-
-        local_name = get_local_name(uri)
-        namespace = get_namespace(uri, local_name)
-
-        namespace_counts[namespace] = namespace_counts.get(namespace, 0) + 1
-
-        G.add_node(
-            uri,
-            label=label,
-            namespace=namespace,
-            description=comment[:200] if comment else label,
-            color=ONTOLOGY_COLORS.get(namespace, ONTOLOGY_COLORS['unknown'])
-        )
-
-    # Fetch relationships
-    relationships_query = """
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-
-    SELECT DISTINCT ?subject ?predicate ?object
-    WHERE {
-      {
-        ?subject rdfs:subClassOf ?object .
-        BIND(rdfs:subClassOf as ?predicate)
-      } UNION {
-        ?subject owl:equivalentClass ?object .
-        BIND(owl:equivalentClass as ?predicate)
-      } UNION {
-        ?subject rdfs:seeAlso ?object .
-        BIND(rdfs:seeAlso as ?predicate)
-      }
-      FILTER(isURI(?object))
-    }
-    LIMIT 1000
-    """
-
-    relationships = query_fuseki(relationships_query)
-
-    # Add edges
-    edge_counts = {}
-    for rel in relationships:
-        subject = rel['subject']['value']
-        predicate = rel['predicate']['value']
-        obj = rel['object']['value']
-
-        if subject in G.nodes and obj in G.nodes:
-            rel_type = get_local_name(predicate)
-            edge_counts[rel_type] = edge_counts.get(rel_type, 0) + 1
+    refresh_button = mo.ui.button(value=0, on_click=_on_refresh, label="🔄 Refresh from Fuseki")
+    refresh_button
+    return (refresh_button,)
 
-            G.add_edge(subject, obj, relationship=rel_type)
 
-    ontology_graph = G
-    stats = {
-        'nodes': len(G.nodes),
-        'edges': len(G.edges),
-        'namespaces': namespace_counts,
-        'relationships': edge_counts
-    }
+@app.cell
+def _(
+    CLASSES_QUERY,
+    DATASET,
+    FUSEKI_URL,
+    ONTOLOGY_COLORS,
+    RELATIONSHIPS_QUERY,
+    cached_load,
+    fuseki,
+    get_local_name,
+    get_namespace,
+    nx,
+    refresh_button,
+):
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _load():
+        """Query Fuseki and build the explorer data"""
+        # Both queries are independent: relationships load in the background while
+        # class bindings are streamed straight into the node records
+        with ThreadPoolExecutor(max_workers=1) as _pool:
+            _relationships_future = _pool.submit(list, fuseki.paginate(RELATIONSHIPS_QUERY))
+
+            # Build NetworkX graph
+            G = nx.DiGraph()
+
+            # Add nodes in one bulk call
+            namespace_counts = {}
+            node_records = []
+            valid_nodes = set()
+            for cls in fuseki.paginate(CLASSES_QUERY):
+                uri = cls['class']['value']
+                label = cls.get('label', {}).get('value', get_local_name(uri))
+                comment = cls.get('comment', {}).get('value', '')
+
+                local_name = get_local_name(uri)
+                namespace = get_namespace(uri, local_name)
+
+                namespace_counts[namespace] = namespace_counts.get(namespace, 0) + 1
+                valid_nodes.add(uri)
+
+                node_records.append((uri, {
+                    'label': label,
+                    'namespace': namespace,
+                    'description': comment[:200] if comment else label,
+                    'color': ONTOLOGY_COLORS.get(namespace, ONTOLOGY_COLORS['unknown'])
+                }))
+
+            G.add_nodes_from(node_records)
+
+            relationships = _relationships_future.result()
+
+        # Add edges in one bulk call, keeping only those between known nodes
+        edge_records = [
+            (rel['subject']['value'], rel['object']['value'],
+             {'relationship': get_local_name(rel['predicate']['value'])})
+            for rel in relationships
+            if rel['subject']['value'] in valid_nodes and rel['object']['value'] in valid_nodes
+        ]
+
+        edge_counts = {}
+        for _, _, attrs in edge_records:
+            edge_counts[attrs['relationship']] = edge_counts.get(attrs['relationship'], 0) + 1
+
+        G.add_edges_from(edge_records)
+
+        return G, {
+            'nodes': len(G.nodes),
+            'edges': len(G.edges),
+            'namespaces': namespace_counts,
+            'relationships': edge_counts
+        }
+
+    # Served from disk unless the refresh button cleared the cache; reading
+    # refresh_button.value makes this cell re-run on every click
+    refresh_button.value
+    ontology_graph, stats = cached_load(
+        'yfiles', (FUSEKI_URL, DATASET, CLASSES_QUERY, RELATIONSHIPS_QUERY), _load
+    )
     return ontology_graph, stats
 
 
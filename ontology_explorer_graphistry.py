@@ -12,10 +12,29 @@ app = marimo.App(width="full")
 @app.cell
 def _():
     import marimo as mo
-    import httpx
     import pandas as pd
     import graphistry
-    return graphistry, httpx, mo, pd
+    from src.agentic_graph_middleware.visualization.ontology_loader import (
+        CLASSES_QUERY,
+        RELATIONSHIPS_QUERY,
+        FusekiSPARQLClient,
+        cached_load,
+        clear_cache,
+        get_local_names,
+        get_namespaces,
+    )
+    return (
+        CLASSES_QUERY,
+        FusekiSPARQLClient,
+        RELATIONSHIPS_QUERY,
+        cached_load,
+        clear_cache,
+        get_local_names,
+        get_namespaces,
+        graphistry,
+        mo,
+        pd,
+    )
 
 
 @app.cell
@@ -57,56 +76,13 @@ def _():
 
 
 @app.cell
-def _(DATASET, FUSEKI_URL, PASSWORD, USERNAME, httpx):
-    def query_fuseki(query: str):
-        """Execute SPARQL query"""
-        _client = httpx.Client(auth=(USERNAME, PASSWORD), timeout=30.0)
-        _endpoint = f"{FUSEKI_URL}/{DATASET}/sparql"
-        _response = _client.post(
-            _endpoint,
-            data={'query': query},
-            headers={'Accept': 'application/sparql-results+json'}
-        )
-        _response.raise_for_status()
-        _results = _response.json()
-        _client.close()
-        return _results['results']['bindings']
-    return (query_fuseki,)
+def _(DATASET, FUSEKI_URL, FusekiSPARQLClient, PASSWORD, USERNAME):
+    import atexit
 
-
-@app.cell
-def _():
-    def get_namespace(uri: str, local_name: str) -> str:
-        """Determine ontology namespace"""
-        _uri_lower = uri.lower()
-        _local_lower = local_name.lower()
-
-        if any(_x in _local_lower for _x in ['databusinesscanvas', 'customersegment', 'valueproposition',
-                                            'revenuestream', 'coststructure', 'dataasset', 'intelligencecapability']):
-            return 'dbc'
-        elif 'bridge' in _uri_lower or any(_x in _local_lower for _x in ['channel', 'customerrelationship', 'keyresource',
-                                                                       'keyactivity', 'keypartner', 'dataproduct',
-                                                                       'dataservice', 'executivetarget']):
-            return 'bridge'
-        elif 'sow' in _uri_lower or 'semanticsowcontract' in _local_lower:
-            return 'sow'
-        elif 'gist' in _uri_lower and 'bridge' not in _uri_lower:
-            return 'gist'
-        elif 'owl' in _uri_lower or 'www.w3.org/2002/07/owl' in uri:
-            return 'owl'
-        elif 'rdf' in _uri_lower or 'www.w3.org/1999/02/22-rdf-syntax-ns' in uri:
-            return 'rdf'
-        else:
-            return 'unknown'
-
-    def get_local_name(uri: str) -> str:
-        """Extract local name from URI"""
-        if '#' in uri:
-            return uri.split('#')[-1]
-        elif '/' in uri:
-            return uri.split('/')[-1]
-        return uri
-    return get_local_name, get_namespace
+    # One keep-alive client for every SPARQL call instead of a handshake per query
+    fuseki = FusekiSPARQLClient(FUSEKI_URL, DATASET, auth=(USERNAME, PASSWORD))
+    atexit.register(fuseki.close)
+    return (fuseki,)
 
 
 @app.cell
@@ -116,82 +92,75 @@ def _(mo):
 
 
 @app.cell
-def _(ONTOLOGY_COLORS, get_local_name, get_namespace, pd, query_fuseki):
-    # Fetch classes
-    classes_query = """
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-    SELECT DISTINCT ?class ?label ?comment
-    WHERE {
-      ?class a owl:Class .
-      OPTIONAL { ?class rdfs:label ?label }
-      OPTIONAL { ?class rdfs:comment ?comment }
-    }
-    """
+def _(clear_cache, mo):
+    def _on_refresh(count):
+        clear_cache()
+        return count + 1
 
-    _classes = query_fuseki(classes_query)
+    refresh_button = mo.ui.button(value=0, on_click=_on_refresh, label="🔄 Refresh from Fuseki")
+    refresh_button
+    return (refresh_button,)
 
-    # Build nodes dataframe
-    _nodes_data = []
-    for _cls in _classes:
-        _uri = _cls['class']['value']
-        _label = _cls.get('label', {}).get('value', get_local_name(_uri))
-        _comment = _cls.get('comment', {}).get('value', '')
 
-        _local_name = get_local_name(_uri)
-        _ns = get_namespace(_uri, _local_name)
-
-        _nodes_data.append({
-            'node': _uri,
-            'label': _label,
-            'namespace': _ns,
-            'description': _comment[:200] if _comment else _label,
-            'color': ONTOLOGY_COLORS.get(_ns, ONTOLOGY_COLORS['unknown'])
+@app.cell
+def _(
+    CLASSES_QUERY,
+    DATASET,
+    FUSEKI_URL,
+    ONTOLOGY_COLORS,
+    RELATIONSHIPS_QUERY,
+    cached_load,
+    fuseki,
+    get_local_names,
+    get_namespaces,
+    pd,
+    refresh_button,
+):
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _load():
+        """Query Fuseki and build the explorer data"""
+        # Both queries are independent; overlap their round-trips on the pooled client
+        with ThreadPoolExecutor(max_workers=2) as _pool:
+            _classes_future = _pool.submit(fuseki.query_frame, CLASSES_QUERY)
+            _relationships_future = _pool.submit(fuseki.query_frame, RELATIONSHIPS_QUERY)
+            _classes = _classes_future.result()
+            _relationships = _relationships_future.result()
+
+        # Build nodes dataframe from the result columns with pandas string kernels
+        _uris = _classes['class']
+        _labels = _classes['label']
+        _comments = _classes['comment'].fillna('')
+
+        _local_names = get_local_names(_uris)
+        _labels = _labels.fillna(_local_names)
+        _namespaces = get_namespaces(_uris, _local_names)
+
+        nodes_df = pd.DataFrame({
+            'node': _uris,
+            'label': _labels,
+            'namespace': _namespaces,
+            'description': _comments.str.slice(0, 200).where(_comments.str.len() > 0, _labels),
+            'color': _namespaces.map(ONTOLOGY_COLORS)
         })
 
-    nodes_df = pd.DataFrame(_nodes_data)
-
-    # Fetch relationships
-    relationships_query = """
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-
-    SELECT DISTINCT ?subject ?predicate ?object
-    WHERE {
-      {
-        ?subject rdfs:subClassOf ?object .
-        BIND(rdfs:subClassOf as ?predicate)
-      } UNION {
-        ?subject owl:equivalentClass ?object .
-        BIND(owl:equivalentClass as ?predicate)
-      } UNION {
-        ?subject rdfs:seeAlso ?object .
-        BIND(rdfs:seeAlso as ?predicate)
-      }
-      FILTER(isURI(?object))
-    }
-    """
-
-    _relationships = query_fuseki(relationships_query)
-
-    # Build edges dataframe
-    _edges_data = []
-    _valid_nodes = set(nodes_df['node'])
-    for _rel in _relationships:
-        _subject = _rel['subject']['value']
-        _predicate = _rel['predicate']['value']
-        _obj = _rel['object']['value']
-
-        if _subject in _valid_nodes and _obj in _valid_nodes:
-            _rel_type = get_local_name(_predicate)
-            _edges_data.append({
-                'src': _subject,
-                'dst': _obj,
-                'relationship': _rel_type
-            })
-
-    edges_df = pd.DataFrame(_edges_data)
+        # Build edges dataframe, keeping only edges whose endpoints are known nodes
+        edges_df = _relationships.rename(columns={'subject': 'src', 'object': 'dst'})
+        edges_df = edges_df[edges_df['src'].isin(_uris) & edges_df['dst'].isin(_uris)]
+        edges_df = pd.DataFrame({
+            'src': edges_df['src'],
+            'dst': edges_df['dst'],
+            'relationship': get_local_names(edges_df['predicate'])
+        }).reset_index(drop=True)
+
+        return edges_df, nodes_df
+
+    # Served from disk unless the refresh button cleared the cache; reading
+    # refresh_button.value makes this cell re-run on every click
+    refresh_button.value
+    edges_df, nodes_df = cached_load(
+        'graphistry', (FUSEKI_URL, DATASET, CLASSES_QUERY, RELATIONSHIPS_QUERY), _load
+    )
 
     return edges_df, nodes_df
 
@@ -12,11 +12,32 @@ app = marimo.App(width="full")
 @app.cell
 def _():
     import marimo as mo
-    import httpx
     import networkx as nx
+    import numpy as np
     import plotly.graph_objects as go
     from collections import defaultdict
-    return go, httpx, mo, nx
+    from src.agentic_graph_middleware.visualization.ontology_loader import (
+        CLASSES_QUERY,
+        RELATIONSHIPS_QUERY,
+        FusekiSPARQLClient,
+        cached_load,
+        clear_cache,
+        get_local_name,
+        get_namespace,
+    )
+    return (
+        CLASSES_QUERY,
+        FusekiSPARQLClient,
+        RELATIONSHIPS_QUERY,
+        cached_load,
+        clear_cache,
+        get_local_name,
+        get_namespace,
+        go,
+        mo,
+        np,
+        nx,
+    )
 
 
 @app.cell
@@ -58,56 +79,13 @@ def _():
 
 
 @app.cell
-def _(DATASET, FUSEKI_URL, PASSWORD, USERNAME, httpx):
-    def query_fuseki(query: str):
-        """Execute SPARQL query"""
-        client = httpx.Client(auth=(USERNAME, PASSWORD), timeout=30.0)
-        endpoint = f"{FUSEKI_URL}/{DATASET}/sparql"
-        response = client.post(
-            endpoint,
-            data={'query': query},
-            headers={'Accept': 'application/sparql-results+json'}
-        )
-        response.raise_for_status()
-        results = response.json()
-        client.close()
-        return results['results']['bindings']
-    return (query_fuseki,)
+def _(DATASET, FUSEKI_URL, FusekiSPARQLClient, PASSWORD, USERNAME):
+    import atexit
 
-
-@app.cell
-def _():
-    def get_namespace(uri: str, local_name: str) -> str:
-        """Determine ontology namespace"""
-        uri_lower = uri.lower()
-        local_lower = local_name.lower()
-
-        if any(x in local_lower for x in ['databusinesscanvas', 'customersegment', 'valueproposition',
-                                            'revenuestream', 'coststructure', 'dataasset', 'intelligencecapability']):
-            return 'dbc'
-        elif 'bridge' in uri_lower or any(x in local_lower for x in ['channel', 'customerrelationship', 'keyresource',
-                                                                       'keyactivity', 'keypartner', 'dataproduct',
-                                                                       'dataservice', 'executivetarget']):
-            return 'bridge'
-        elif 'sow' in uri_lower or 'semanticsowcontract' in local_lower:
-            return 'sow'
-        elif 'gist' in uri_lower and 'bridge' not in uri_lower:
-            return 'gist'
-        elif 'owl' in uri_lower or 'www.w3.org/2002/07/owl' in uri:
-            return 'owl'
-        elif 'rdf' in uri_lower or 'www.w3.org/1999/02/22-rdf-syntax-ns' in uri:
-            return 'rdf'
-        else:
-            return 'unknown'
-
-    def get_local_name(uri: str) -> str:
-        """Extract local name from URI"""
-        if '#' in uri:
-            return uri.split('#')[-1]
-        elif '/' in uri:
-            return uri.split('/')[-1]
-        return uri
-    return get_local_name, get_namespace
+    # One keep-alive client for every SPARQL call instead of a handshake per query
+    fuseki = FusekiSPARQLClient(FUSEKI_URL, DATASET, auth=(USERNAME, PASSWORD))
+    atexit.register(fuseki.close)
+    return (fuseki,)
 
 
 @app.cell
@@ -117,88 +95,95 @@ def _(mo):
 
 
 @app.cell
-def _(ONTOLOGY_COLORS, get_local_name, get_namespace, nx, query_fuseki):
-    # Fetch classes
-    classes_query = """
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-    SELECT DISTINCT ?class ?label ?comment
-    WHERE {
-      ?class a owl:Class .
-      OPTIONAL { ?class rdfs:label ?label }
-      OPTIONAL { ?class rdfs:comment ?comment }
-    }
-    """
-
-    classes = query_fuseki(classes_query)
-
-    # Build NetworkX graph
-    G = nx.DiGraph()
+def _(clear_cache, mo):
+    def _on_refresh(count):
+        clear_cache()
+        return count + 1
 
-    # Add nodes
-    namespace_counts = {}
-    for _cls in classes:
-        _uri = _cls['class']['value']
-        _label = _cls.get('label', {}).get('value', get_local_name(_uri))
-        _comment = _cls.get('comment', {}).get('value', '')
+    refresh_button = mo.ui.button(value=0, on_click=_on_refresh, label="🔄 Refresh from Fuseki")
+    refresh_button
+    return (refresh_button,)
 
-        _local_name = get_local_name(_uri)
-        _namespace = get_namespace(_uri, _local_name)
-
-        namespace_counts[_namespace] = namespace_counts.get(_namespace, 0) + 1
-
-        G.add_node(
-            _uri,
-            label=_label,
-            namespace=_namespace,
-            description=_comment[:200] if _comment else _label,
-            color=ONTOLOGY_COLORS.get(_namespace, ONTOLOGY_COLORS['unknown'])
-        )
 
-    # Fetch relationships
-    relationships_query = """
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-
-    SELECT DISTINCT ?subject ?predicate ?object
-    WHERE {
-      {
-        ?subject rdfs:subClassOf ?object .
-        BIND(rdfs:subClassOf as ?predicate)
-      } UNION {
-        ?subject owl:equivalentClass ?object .
-        BIND(owl:equivalentClass as ?predicate)
-      } UNION {
-        ?subject rdfs:seeAlso ?object .
-        BIND(rdfs:seeAlso as ?predicate)
-      }
-      FILTER(isURI(?object))
-    }
-    """
-
-    relationships = query_fuseki(relationships_query)
-
-    # Add edges
-    edge_counts = {}
-    for _rel in relationships:
-        _subject = _rel['subject']['value']
-        _predicate = _rel['predicate']['value']
-        _obj = _rel['object']['value']
-
-        if _subject in G.nodes and _obj in G.nodes:
-            _rel_type = get_local_name(_predicate)
-            edge_counts[_rel_type] = edge_counts.get(_rel_type, 0) + 1
-
-            G.add_edge(_subject, _obj, relationship=_rel_type)
-
-    ontology_graph = G
-    graph_stats = {
-        'nodes': len(G.nodes),
-        'edges': len(G.edges),
-        'namespaces': namespace_counts,
-        'relationships': edge_counts
-    }
+@app.cell
+def _(
+    CLASSES_QUERY,
+    DATASET,
+    FUSEKI_URL,
+    ONTOLOGY_COLORS,
+    RELATIONSHIPS_QUERY,
+    cached_load,
+    fuseki,
+    get_local_name,
+    get_namespace,
+    nx,
+    refresh_button,
+):
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _load():
+        """Query Fuseki and build the explorer data"""
+        # Both queries are independent: relationships load in the background while
+        # class bindings are streamed straight into the node records
+        with ThreadPoolExecutor(max_workers=1) as _pool:
+            _relationships_future = _pool.submit(fuseki.query, RELATIONSHIPS_QUERY)
+
+            # Build NetworkX graph
+            G = nx.DiGraph()
+
+            # Add nodes in one bulk call
+            namespace_counts = {}
+            node_records = []
+            valid_nodes = set()
+            for _cls in fuseki.stream(CLASSES_QUERY):
+                _uri = _cls['class']['value']
+                _label = _cls.get('label', {}).get('value', get_local_name(_uri))
+                _comment = _cls.get('comment', {}).get('value', '')
+
+                _local_name = get_local_name(_uri)
+                _namespace = get_namespace(_uri, _local_name)
+
+                namespace_counts[_namespace] = namespace_counts.get(_namespace, 0) + 1
+                valid_nodes.add(_uri)
+
+                node_records.append((_uri, {
+                    'label': _label,
+                    'namespace': _namespace,
+                    'description': _comment[:200] if _comment else _label,
+                    'color': ONTOLOGY_COLORS.get(_namespace, ONTOLOGY_COLORS['unknown'])
+                }))
+
+            G.add_nodes_from(node_records)
+
+            _relationships = _relationships_future.result()
+
+        # Add edges in one bulk call, keeping only those between known nodes
+        edge_records = [
+            (_rel['subject']['value'], _rel['object']['value'],
+             {'relationship': get_local_name(_rel['predicate']['value'])})
+            for _rel in _relationships
+            if _rel['subject']['value'] in valid_nodes and _rel['object']['value'] in valid_nodes
+        ]
+
+        edge_counts = {}
+        for _, _, _attrs in edge_records:
+            edge_counts[_attrs['relationship']] = edge_counts.get(_attrs['relationship'], 0) + 1
+
+        G.add_edges_from(edge_records)
+
+        return G, {
+            'nodes': len(G.nodes),
+            'edges': len(G.edges),
+            'namespaces': namespace_counts,
+            'relationships': edge_counts
+        }
+
+    # Served from disk unless the refresh button cleared the cache; reading
+    # refresh_button.value makes this cell re-run on every click
+    refresh_button.value
+    ontology_graph, graph_stats = cached_load(
+        'plotly', (FUSEKI_URL, DATASET, CLASSES_QUERY, RELATIONSHIPS_QUERY), _load
+    )
     return graph_stats, ontology_graph
 
 
@@ -228,69 +213,63 @@ def _(mo):
 
 
 @app.cell
-def _(go, mo, nx, ontology_graph):
-    # Use spring layout for positioning
+def _(go, mo, np, nx, ontology_graph):
+    # Use spring layout for positioning. NetworkX runs Fruchterman-Reingold as
+    # vectorized NumPy (sparse SciPy past 500 nodes), so no compiled layout is needed
     pos = nx.spring_layout(ontology_graph, k=2, iterations=50, seed=42)
 
-    # Create edge traces
-    edge_traces = []
-    for _edge in ontology_graph.edges():
-        _x0, _y0 = pos[_edge[0]]
-        _x1, _y1 = pos[_edge[1]]
-        _edge_trace = go.Scatter(
-            x=[_x0, _x1, None],
-            y=[_y0, _y1, None],
-            mode='lines',
-            line=dict(width=1, color='#888'),
-            hoverinfo='none',
-            showlegend=False
-        )
-        edge_traces.append(_edge_trace)
-
-    # Create node traces (one per namespace for legend)
-    node_traces = {}
-    for _node in ontology_graph.nodes():
-        _data = ontology_graph.nodes[_node]
-        _viz_ns = _data['namespace']
-
-        if _viz_ns not in node_traces:
-            node_traces[_viz_ns] = {
-                'x': [],
-                'y': [],
-                'text': [],
-                'color': _data['color'],
-                'name': _viz_ns.upper()
-            }
-
-        _x, _y = pos[_node]
-        node_traces[_viz_ns]['x'].append(_x)
-        node_traces[_viz_ns]['y'].append(_y)
-        node_traces[_viz_ns]['text'].append(
-            f"<b>{_data['label']}</b><br>{_data['namespace'].upper()}<br>{_data['description'][:100]}..."
-        )
+    # One edge trace for all edges: segments separated by None render as
+    # disjoint lines in a single WebGL draw call
+    edge_x = []
+    edge_y = []
+    for _src, _dst in ontology_graph.edges():
+        _x0, _y0 = pos[_src]
+        _x1, _y1 = pos[_dst]
+        edge_x.extend((_x0, _x1, None))
+        edge_y.extend((_y0, _y1, None))
+
+    edge_trace = go.Scattergl(
+        x=edge_x,
+        y=edge_y,
+        mode='lines',
+        line=dict(width=1, color='#888'),
+        hoverinfo='none',
+        showlegend=False
+    )
+
+    # Node attributes as parallel arrays; each namespace trace is one boolean-mask slice
+    _nodes = list(ontology_graph.nodes(data=True))
+    _xy = np.array([pos[_node] for _node, _ in _nodes], dtype=float).reshape(-1, 2)
+    _namespaces = np.array([_data['namespace'] for _, _data in _nodes], dtype=object)
+    _labels = np.array([_data['label'] for _, _data in _nodes], dtype=object)
+    _hover = np.array([
+        f"<b>{_data['label']}</b><br>{_data['namespace'].upper()}<br>{_data['description'][:100]}..."
+        for _, _data in _nodes
+    ], dtype=object)
+    _colors = {_data['namespace']: _data['color'] for _, _data in reversed(_nodes)}
 
     # Create plotly figure
     fig = go.Figure()
 
     # Add edges
-    for _trace in edge_traces:
-        fig.add_trace(_trace)
-
-    # Add nodes by namespace
-    for _ns_data in node_traces.values():
-        fig.add_trace(go.Scatter(
-            x=_ns_data['x'],
-            y=_ns_data['y'],
+    fig.add_trace(edge_trace)
+
+    # Add nodes by namespace: one WebGL trace per namespace keeps legend toggling
+    for _viz_ns in dict.fromkeys(_namespaces):
+        _mask = _namespaces == _viz_ns
+        fig.add_trace(go.Scattergl(
+            x=_xy[_mask, 0],
+            y=_xy[_mask, 1],
             mode='markers+text',
-            name=_ns_data['name'],
-            text=[_t.split('<br>')[0].replace('<b>', '').replace('</b>', '') for _t in _ns_data['text']],
+            name=_viz_ns.upper(),
+            text=_labels[_mask],
             textposition='top center',
             textfont=dict(size=9),
-            hovertext=_ns_data['text'],
+            hovertext=_hover[_mask],
             hoverinfo='text',
             marker=dict(
                 size=20,
-                color=_ns_data['color'],
+                color=_colors[_viz_ns],
                 line=dict(width=2, color='white')
             )
         ))
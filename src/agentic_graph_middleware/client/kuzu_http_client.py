@@ -3,13 +3,36 @@ KuzuDB HTTP Client
 Provides HTTP-based connection to containerized KuzuDB API
 """
 
-import requests
+import json
+import httpx
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _dump_json(payload: Any) -> bytes:
+    """Encode a JSON request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload).encode()
+
+
+def _parse_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 @dataclass
 class KuzuQueryResult:
     """Result from KuzuDB HTTP query"""
@@ -23,23 +46,40 @@ class KuzuHTTPClient:
 
     def __init__(self, base_url: str = "http://localhost:8080"):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        # Share keep-alive sockets across /query calls; ask the API to
+        # compress large node lists and query results
+        self.session = httpx.Client(
+            base_url=self.base_url,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            headers={'Accept-Encoding': 'gzip'}
+        )
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def health_check(self) -> bool:
         """Check if KuzuDB API is healthy"""
         try:
-            response = self.session.get(f"{self.base_url}/health", timeout=5)
+            response = self.session.get("/health", timeout=5)
             return response.status_code == 200
-        except requests.RequestException:
+        except httpx.HTTPError:
             return False
 
     def get_status(self) -> Dict[str, Any]:
         """Get database status and statistics"""
         try:
-            response = self.session.get(f"{self.base_url}/status", timeout=10)
+            response = self.session.get("/status", timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return _parse_json(response.content)
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(f"Failed to get status: {e}")
             return {"status": "error", "error": str(e)}
 
@@ -50,14 +90,10 @@ class KuzuHTTPClient:
             if parameters:
                 payload["parameters"] = parameters
 
-            response = self.session.post(
-                f"{self.base_url}/query",
-                json=payload,
-                timeout=30
-            )
+            response = self.session.post("/query", content=_dump_json(payload), headers=_JSON_HEADERS)
             response.raise_for_status()
 
-            result_data = response.json()
+            result_data = _parse_json(response.content)
             return KuzuQueryResult(
                 success=result_data["success"],
                 data=result_data["data"],
@@ -65,7 +101,7 @@ class KuzuHTTPClient:
                 count=result_data["count"]
             )
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(f"Query execution failed: {e}")
             return KuzuQueryResult(
                 success=False,
@@ -74,6 +110,43 @@ class KuzuHTTPClient:
                 count=0
             )
 
+    def execute_batch(self, statements: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[KuzuQueryResult]:
+        """Execute several Cypher queries in one HTTP round-trip, returning one result per statement"""
+        try:
+            batch = []
+            for cypher, parameters in statements:
+                entry = {"cypher": cypher}
+                if parameters:
+                    entry["parameters"] = parameters
+                batch.append(entry)
+
+            response = self.session.post(
+                "/query/batch", content=_dump_json({"batch": batch}), headers=_JSON_HEADERS
+            )
+            response.raise_for_status()
+
+            return [
+                KuzuQueryResult(
+                    success=result_data["success"],
+                    data=result_data["data"],
+                    error=result_data.get("error"),
+                    count=result_data["count"]
+                )
+                for result_data in _parse_json(response.content)
+            ]
+
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Batch execution failed: {e}")
+            return [
+                KuzuQueryResult(
+                    success=False,
+                    data=[],
+                    error=str(e),
+                    count=0
+                )
+                for _ in statements
+            ]
+
     def get_nodes(self, limit: int = 100, offset: int = 0, node_type: Optional[str] = None) -> KuzuQueryResult:
         """Get ontology nodes with optional filtering"""
         try:
@@ -81,10 +154,10 @@ class KuzuHTTPClient:
             if node_type:
                 params["node_type"] = node_type
 
-            response = self.session.get(f"{self.base_url}/nodes", params=params, timeout=30)
+            response = self.session.get("/nodes", params=params)
             response.raise_for_status()
 
-            result_data = response.json()
+            result_data = _parse_json(response.content)
             return KuzuQueryResult(
                 success=result_data["success"],
                 data=result_data["data"],
@@ -92,7 +165,7 @@ class KuzuHTTPClient:
                 count=result_data["count"]
             )
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(f"Failed to get nodes: {e}")
             return KuzuQueryResult(
                 success=False,
@@ -110,23 +183,23 @@ class KuzuHTTPClient:
 
     def get_ontology_statistics(self) -> Dict[str, Any]:
         """Get comprehensive ontology statistics"""
-        stats = {}
-
-        # Get total node count
-        stats["total_nodes"] = self.get_node_count()
-
-        # Get node type distribution
-        type_result = self.execute_query("""
-            MATCH (n:OntologyConcept)
-            RETURN n.concept_type as type, COUNT(n) as count
+        stats = {"total_nodes": 0, "node_types": {}}
+
+        # Total node count and node type distribution in one round-trip:
+        # every row carries the total, plus one (type, count) pair
+        result = self.execute_query("""
+            MATCH (n)
+            WITH COUNT(n) AS total
+            OPTIONAL MATCH (m:OntologyConcept)
+            RETURN total, m.concept_type AS type, COUNT(m) AS count
         """)
 
-        if type_result.success:
+        if result.success and result.data:
+            stats["total_nodes"] = result.data[0].get("col_0", 0)
             stats["node_types"] = {
-                row.get("col_0", "unknown"): row.get("col_1", 0)
-                for row in type_result.data
+                row.get("col_1", "unknown"): row.get("col_2", 0)
+                for row in result.data
+                if row.get("col_2", 0)
             }
-        else:
-            stats["node_types"] = {}
 
-        return stats
\ No newline at end of file
+        return stats
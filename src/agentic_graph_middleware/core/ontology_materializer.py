@@ -7,15 +7,73 @@ into KuzuDB for high-performance graph operations and visualization.
 
 import kuzu
 import logging
+import os
+import pandas as pd
+import sys
+import threading
+from itertools import islice
+from contextlib import contextmanager, suppress
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
-from rdflib import Graph, Namespace, URIRef, Literal
-from rdflib.namespace import RDF, RDFS, OWL, SKOS
+from rdflib import BNode, Graph, Namespace, URIRef, Literal
+from rdflib.namespace import RDF, RDFS, OWL, SKOS, XSD
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+
+try:
+    import pyoxigraph
+except ImportError:  # optional; without it ontology files are parsed by rdflib
+    pyoxigraph = None
 
 logger = logging.getLogger(__name__)
 
+# rdf:type objects and predicates mapped to stored types; looked up by URIRef
+# instead of substring tests on the URI string
+_CONCEPT_TYPE_MAP = {
+    OWL.Class: "class",
+    OWL.DeprecatedClass: "class",
+    RDFS.Class: "class",
+    OWL.ObjectProperty: "property",
+    OWL.DatatypeProperty: "property",
+    OWL.AnnotationProperty: "property",
+    OWL.FunctionalProperty: "property",
+    OWL.InverseFunctionalProperty: "property",
+    OWL.TransitiveProperty: "property",
+    OWL.SymmetricProperty: "property",
+    OWL.AsymmetricProperty: "property",
+    OWL.ReflexiveProperty: "property",
+    OWL.IrreflexiveProperty: "property",
+    OWL.DeprecatedProperty: "property",
+    OWL.OntologyProperty: "property",
+    RDF.Property: "property",
+    OWL.NamedIndividual: "individual",
+}
+
+_RELATIONSHIP_TYPE_MAP = {
+    RDFS.subClassOf: "subclass",
+    RDFS.subPropertyOf: "subproperty",
+    RDFS.domain: "domain",
+    RDFS.range: "range",
+    OWL.inverseOf: "inverse",
+    RDFS.seeAlso: "reference",
+}
+
+# Full-text index over concept text; Kuzu keeps it current on every insert
+_TEXT_INDEX_NAME = "concept_text_idx"
+_TEXT_INDEX_PROPERTIES = ["label", "description"]
+
+# N-Triples lines handed to rdflib's parser at a time when streaming a file
+_NTRIPLES_CHUNK_LINES = 10_000
+
+# Predicates describing the subject node itself rather than an edge; one set probe
+# per triple instead of a chain of URIRef comparisons
+_ANNOTATION_PREDICATES = frozenset({RDFS.label, SKOS.prefLabel, RDFS.comment, SKOS.definition})
+_NODE_PREDICATES = _ANNOTATION_PREDICATES | {RDF.type}
+
+# When a subject declares several types, the lowest rank wins
+_CONCEPT_TYPE_RANK = {"class": 0, "individual": 1, "property": 2, "concept": 3}
+
 
 @dataclass
 class OntologyNode:
@@ -36,20 +94,94 @@ class OntologyRelationship:
     relationship_type: str
 
 
+class _ConnectionPool:
+    """Kuzu connections over one Database, each handed to a single caller at a time"""
+
+    def __init__(self, db: kuzu.Database, max_connections: int):
+        self.db = db
+        self._idle: List[kuzu.Connection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection, opening one lazily if none is idle"""
+        self._slots.acquire()
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = kuzu.Connection(self.db)
+            try:
+                yield conn
+            finally:
+                with self._lock:
+                    self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close every idle pooled connection"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
 class OntologyMaterializer:
     """
     Materializes OWL/RDF ontologies into KuzuDB graph structure
     for high-performance semantic operations and visualization
     """
 
-    def __init__(self, kuzu_db_path: str):
-        self.db = kuzu.Database(kuzu_db_path)
+    def __init__(self, kuzu_db_path: str, bulk_load: bool = False,
+                 max_connections: Optional[int] = None, text_index: bool = False):
+        # Bulk loads skip automatic checkpoints and checkpoint once per materialization,
+        # and defer index creation to finalize()
+        self.bulk_load = bulk_load
+        self.text_index = text_index
+        self.db = kuzu.Database(kuzu_db_path, auto_checkpoint=not bulk_load)
         self.conn = kuzu.Connection(self.db)
+        # Reads go through pooled connections so concurrent callers don't share self.conn
+        self._pool = _ConnectionPool(self.db, max_connections or os.cpu_count() or 1)
         self._initialize_ontology_schema()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.finalize()
+        finally:
+            # A failed CHECKPOINT or index build must not leave the database locked
+            self.close()
+
+    def finalize(self):
+        """Checkpoint and build the indexes deferred by a bulk load"""
+
+        self.conn.execute("CHECKPOINT")
+        self._create_indexes()
+
+    def close(self):
+        """Close the connections and the database"""
+        self._pool.close()
+        self.conn.close()
+        self.db.close()
+
     def _initialize_ontology_schema(self):
         """Initialize KuzuDB schema for pure ontology storage"""
 
+        self._create_tables()
+        # Indexes are maintained row by row, so a bulk load builds them once at the end
+        if not self.bulk_load:
+            self._create_indexes()
+
+        logger.info("KuzuDB ontology schema initialized")
+
+    def _create_tables(self):
+        """Create the ontology node and relationship tables"""
+
         # Create node table for ontology concepts
         self.conn.execute("""
             CREATE NODE TABLE IF NOT EXISTS OntologyConcept(
@@ -73,177 +205,341 @@ class OntologyMaterializer:
             )
         """)
 
-        logger.info("KuzuDB ontology schema initialized")
+    def _create_indexes(self):
+        """Create the secondary indexes requested for this database"""
+
+        # PRIMARY KEY (uri) is already hash-indexed; full-text search is opt-in
+        if not self.text_index:
+            return
+
+        self.conn.execute("LOAD EXTENSION fts")
+        existing = self.conn.execute("CALL SHOW_INDEXES() RETURN index_name")
+        while existing.has_next():
+            if existing.get_next()[0] == _TEXT_INDEX_NAME:
+                return
+
+        # CREATE_FTS_INDEX only takes literal arguments, not query parameters
+        properties = ", ".join(f"'{prop}'" for prop in _TEXT_INDEX_PROPERTIES)
+        self.conn.execute(
+            f"CALL CREATE_FTS_INDEX('OntologyConcept', '{_TEXT_INDEX_NAME}', [{properties}])"
+        )
+        logger.info("KuzuDB full-text index created")
 
-    def materialize_rdf_graph(self, rdf_graph: Graph) -> Dict[str, int]:
+    def materialize_rdf_graph(self, rdf_graph: Graph, batch_size: int = 10_000) -> Dict[str, int]:
         """
         Materialize an RDF graph into KuzuDB
         Returns statistics about materialized nodes and relationships
         """
 
-        nodes_created = 0
-        relationships_created = 0
-
-        # Extract and materialize ontology concepts (nodes)
-        for subj, pred, obj in rdf_graph:
-            if pred == RDF.type:
-                # This is a class/property/individual declaration
-                concept_type = self._determine_concept_type(obj)
-                label = self._extract_label(rdf_graph, subj)
-                description = self._extract_description(rdf_graph, subj)
-                namespace = self._extract_namespace(subj)
-
-                self._create_ontology_concept(
-                    uri=str(subj),
-                    label=label,
-                    concept_type=concept_type,
-                    description=description,
-                    namespace=namespace
-                )
-                nodes_created += 1
-
-        # Extract and materialize relationships
-        for subj, pred, obj in rdf_graph:
-            if pred != RDF.type:  # Skip type declarations
-                relationship_type = self._determine_relationship_type(pred)
-
-                self._create_ontology_relationship(
-                    subject_uri=str(subj),
-                    predicate_uri=str(pred),
-                    object_uri=str(obj),
-                    relationship_type=relationship_type
-                )
-                relationships_created += 1
+        return self.materialize_triples(iter(rdf_graph), batch_size=batch_size)
+
+    def materialize_triples(self, triples: Iterable[Tuple[Any, Any, Any]],
+                            batch_size: int = 10_000) -> Dict[str, int]:
+        """
+        Materialize an iterable of (subject, predicate, object) RDF terms into KuzuDB
+        Rows are written in COPY chunks of at most batch_size; larger chunks mean fewer
+        statements, smaller ones bound the memory of each intermediate DataFrame
+        Returns statistics about materialized nodes and relationships
+        """
+
+        # One timestamp for the whole materialization instead of a datetime per row
+        now = datetime.now()
+
+        # Single sweep over the triples: remember each subject's strongest type
+        # declaration, labels and descriptions, and collect every other
+        # resource-valued triple once as a relationship
+        concept_types = {}
+        labels = {}
+        pref_labels = {}
+        comments = {}
+        definitions = {}
+        relationships = {}
+        referenced = {}
+        blank_edges = []
+        annotations = {
+            RDFS.label: labels,
+            SKOS.prefLabel: pref_labels,
+            RDFS.comment: comments,
+            SKOS.definition: definitions
+        }
+
+        # One string object per distinct URI: rows share it instead of holding copies,
+        # and dict and set probes on it short-circuit on identity
+        intern = {}.setdefault
+
+        for subj, pred, obj in triples:
+            if pred in _NODE_PREDICATES:
+                if pred == RDF.type:
+                    # This is a class/property/individual declaration; one row per subject
+                    concept_type = self._determine_concept_type(obj)
+                    current = concept_types.get(subj)
+                    if current is None or _CONCEPT_TYPE_RANK[concept_type] < _CONCEPT_TYPE_RANK[current]:
+                        concept_types[subj] = concept_type
+                else:
+                    annotations[pred].setdefault(subj, obj)
+                continue
+
+            # Literal-valued triples can never join two concepts, so they never become edges
+            if isinstance(obj, Literal):
+                continue
+
+            subject_uri = str(subj)
+            object_uri = str(obj)
+            # Predicates are few and recur constantly, so they go to the global pool
+            key = (intern(subject_uri, subject_uri), sys.intern(str(pred)), intern(object_uri, object_uri))
+            relationships[key] = pred
+            if isinstance(subj, URIRef) and isinstance(obj, URIRef):
+                referenced[subj] = None
+                referenced[obj] = None
+            else:
+                # Whether a blank-node end is a typed concept is only known
+                # once every triple has been seen
+                blank_edges.append((subj, obj))
+
+        # Edges to untyped blank nodes (restrictions, RDF lists) are never
+        # written, so their URI ends must not get stub concepts either
+        for subj, obj in blank_edges:
+            if all(isinstance(term, URIRef) or term in concept_types for term in (subj, obj)):
+                for term in (subj, obj):
+                    if isinstance(term, URIRef):
+                        referenced[term] = None
+
+        # Labels may follow a subject's type declaration, so concept rows are
+        # only built once every triple has been seen
+        concept_rows = []
+        for subj, concept_type in concept_types.items():
+            uri = str(subj)
+            uri = intern(uri, uri)
+            label = labels.get(subj, pref_labels.get(subj))
+            description = comments.get(subj, definitions.get(subj))
+            concept_rows.append({
+                "uri": uri,
+                # Local name: whatever follows the last '#' or '/'
+                "label": str(label) if label is not None else uri[max(uri.rfind("#"), uri.rfind("/")) + 1:],
+                "concept_type": concept_type,
+                "description": str(description) if description is not None else "",
+                "namespace": self._extract_namespace(subj) or "",
+                "timestamp": now
+            })
+
+        # URIs that edges point at without declaring a type (external vocabularies,
+        # owl:Thing, xsd datatypes) become stub concepts so those edges are kept
+        external_rows = [
+            {
+                "uri": str(uri),
+                "label": uri[max(uri.rfind("#"), uri.rfind("/")) + 1:],
+                "concept_type": "external",
+                "description": "",
+                "namespace": self._extract_namespace(uri) or "",
+                "timestamp": now
+            }
+            for uri in referenced if uri not in concept_types
+        ]
+
+        relationship_rows = [
+            {
+                "subject_uri": subject_uri,
+                "predicate_uri": predicate_uri,
+                "object_uri": object_uri,
+                "relationship_type": self._determine_relationship_type(pred),
+                "timestamp": now
+            }
+            for (subject_uri, predicate_uri, object_uri), pred in relationships.items()
+        ]
+
+        # Bulk COPY per table instead of one CREATE per triple, committed
+        # together so the WAL is flushed once rather than after every write
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            stored_uris = self._get_stored_concept_uris()
+
+            # COPY rejects existing primary keys: concepts stored by an earlier
+            # materialization are updated in place, and their stubs are not repeated
+            self._copy_ontology_concepts(
+                [row for row in concept_rows + external_rows if row["uri"] not in stored_uris],
+                batch_size
+            )
+            self._update_ontology_concepts([row for row in concept_rows if row["uri"] in stored_uris])
+
+            known_uris = stored_uris.union(row["uri"] for row in concept_rows + external_rows)
+            relationships_created = self._copy_ontology_relationships(
+                relationship_rows, known_uris, batch_size
+            )
+        except Exception:
+            # Kuzu rolls back by itself when a query fails; this covers any other error
+            with suppress(RuntimeError):
+                self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+        if self.bulk_load:
+            self.conn.execute("CHECKPOINT")
 
         return {
-            "nodes_created": nodes_created,
+            "nodes_created": len(concept_rows),
+            "external_nodes_created": sum(row["uri"] not in stored_uris for row in external_rows),
             "relationships_created": relationships_created
         }
 
-    def _create_ontology_concept(self, uri: str, label: str, concept_type: str,
-                                 description: Optional[str], namespace: Optional[str]):
-        """Create an ontology concept node in KuzuDB"""
+    def materialize_file(self, file_path: str, batch_size: int = 10_000) -> Dict[str, int]:
+        """
+        Materialize an RDF/OWL file into KuzuDB without building an rdflib Graph
+        Returns statistics about materialized nodes and relationships
+        """
+
+        return self.materialize_triples(iter_ontology_triples(file_path), batch_size=batch_size)
+
+    def _copy_ontology_concepts(self, rows: List[Dict[str, Any]], batch_size: int = 10_000):
+        """Bulk load ontology concept nodes into KuzuDB with COPY FROM"""
+
+        for start in range(0, len(rows), batch_size):
+            # COPY maps columns by position onto the OntologyConcept schema
+            concepts = pd.DataFrame(
+                rows[start:start + batch_size],
+                columns=["uri", "label", "concept_type", "description", "namespace", "timestamp"],
+                dtype=object
+            )
+            concepts["timestamp"] = pd.to_datetime(concepts["timestamp"])
+            self.conn.execute("COPY OntologyConcept FROM $concepts", {"concepts": concepts})
+
+    def _copy_ontology_relationships(self, rows: List[Dict[str, Any]], known_uris: Set[str],
+                                     batch_size: int = 10_000) -> int:
+        """Bulk load ontology relationships into KuzuDB with COPY FROM
+        Returns how many rows were copied, i.e. those between known concepts"""
+
+        # COPY rejects dangling endpoints, so keep only rows between known concepts,
+        # which is what the MATCH ... CREATE path does implicitly
+        rows = [row for row in rows
+                if row["subject_uri"] in known_uris and row["object_uri"] in known_uris]
+
+        for start in range(0, len(rows), batch_size):
+            relationships = pd.DataFrame(
+                rows[start:start + batch_size],
+                columns=["subject_uri", "object_uri", "predicate_uri", "relationship_type", "timestamp"],
+                dtype=object
+            )
+            relationships["timestamp"] = pd.to_datetime(relationships["timestamp"])
+            self.conn.execute("COPY OntologyRelationship FROM $relationships",
+                              {"relationships": relationships})
+
+        return len(rows)
+
+    def _get_stored_concept_uris(self) -> Set[str]:
+        """URIs of every concept already in KuzuDB"""
+
+        result = self.conn.execute("MATCH (c:OntologyConcept) RETURN c.uri")
+        uris = set()
+        while result.has_next():
+            uris.add(result.get_next()[0])
+        return uris
+
+    def _update_ontology_concepts(self, rows: List[Dict[str, Any]]):
+        """Overwrite stored ontology concept nodes from a batch of rows"""
+
+        if not rows:
+            return
+
+        self.conn.execute("""
+            UNWIND $rows AS row
+            MATCH (c:OntologyConcept {uri: row.uri})
+            SET c.label = row.label,
+                c.concept_type = row.concept_type,
+                c.description = row.description,
+                c.namespace = row.namespace,
+                c.created_at = row.timestamp
+        """, {"rows": rows})
+
+    def _create_ontology_concepts(self, rows: List[Dict[str, Any]]):
+        """Create ontology concept nodes in KuzuDB from a batch of rows"""
+
+        if not rows:
+            return
 
         self.conn.execute("""
+            UNWIND $rows AS row
             CREATE (c:OntologyConcept {
-                uri: $uri,
-                label: $label,
-                concept_type: $concept_type,
-                description: $description,
-                namespace: $namespace,
-                created_at: $timestamp
+                uri: row.uri,
+                label: row.label,
+                concept_type: row.concept_type,
+                description: row.description,
+                namespace: row.namespace,
+                created_at: row.timestamp
             })
-        """, {
-            "uri": uri,
-            "label": label,
-            "concept_type": concept_type,
-            "description": description or "",
-            "namespace": namespace or "",
-            "timestamp": datetime.now()
-        })
-
-    def _create_ontology_relationship(self, subject_uri: str, predicate_uri: str,
-                                      object_uri: str, relationship_type: str):
-        """Create an ontology relationship in KuzuDB"""
+        """, {"rows": rows})
+
+    def _create_ontology_relationships(self, rows: List[Dict[str, Any]]):
+        """Create ontology relationships in KuzuDB from a batch of rows"""
+
+        if not rows:
+            return
 
         self.conn.execute("""
-            MATCH (s:OntologyConcept {uri: $subject_uri})
-            MATCH (o:OntologyConcept {uri: $object_uri})
+            UNWIND $rows AS row
+            MATCH (s:OntologyConcept {uri: row.subject_uri})
+            MATCH (o:OntologyConcept {uri: row.object_uri})
             CREATE (s)-[:OntologyRelationship {
-                predicate_uri: $predicate_uri,
-                relationship_type: $relationship_type,
-                created_at: $timestamp
+                predicate_uri: row.predicate_uri,
+                relationship_type: row.relationship_type,
+                created_at: row.timestamp
             }]->(o)
-        """, {
-            "subject_uri": subject_uri,
-            "object_uri": object_uri,
-            "predicate_uri": predicate_uri,
-            "relationship_type": relationship_type,
-            "timestamp": datetime.now()
-        })
+        """, {"rows": rows})
 
     def _determine_concept_type(self, rdf_type: URIRef) -> str:
         """Determine the type of ontology concept"""
-        type_str = str(rdf_type)
-
-        if "Class" in type_str:
-            return "class"
-        elif "Property" in type_str:
-            return "property"
-        elif "Individual" in type_str:
-            return "individual"
-        else:
-            return "concept"
+        return _CONCEPT_TYPE_MAP.get(rdf_type, "concept")
 
     def _determine_relationship_type(self, predicate: URIRef) -> str:
         """Determine the type of ontology relationship"""
-        pred_str = str(predicate)
-
-        if "subClassOf" in pred_str:
-            return "subclass"
-        elif "subPropertyOf" in pred_str:
-            return "subproperty"
-        elif "domain" in pred_str:
-            return "domain"
-        elif "range" in pred_str:
-            return "range"
-        elif "inverseOf" in pred_str:
-            return "inverse"
-        elif "seeAlso" in pred_str:
-            return "reference"
-        else:
-            return "semantic_relation"
-
-    def _extract_label(self, graph: Graph, uri: URIRef) -> str:
-        """Extract human-readable label from RDF graph"""
-        for label in graph.objects(uri, RDFS.label):
-            return str(label)
-        for label in graph.objects(uri, SKOS.prefLabel):
-            return str(label)
-        # Fallback to local name
-        return uri.split("#")[-1].split("/")[-1]
-
-    def _extract_description(self, graph: Graph, uri: URIRef) -> Optional[str]:
-        """Extract description from RDF graph"""
-        for desc in graph.objects(uri, RDFS.comment):
-            return str(desc)
-        for desc in graph.objects(uri, SKOS.definition):
-            return str(desc)
-        return None
+        return _RELATIONSHIP_TYPE_MAP.get(predicate, "semantic_relation")
 
     def _extract_namespace(self, uri: URIRef) -> str:
         """Extract namespace from URI"""
         uri_str = str(uri)
         if "#" in uri_str:
-            return uri_str.split("#")[0] + "#"
+            return uri_str.partition("#")[0] + "#"
         else:
-            return "/".join(uri_str.split("/")[:-1]) + "/"
+            return uri_str.rpartition("/")[0] + "/"
+
+    def query_ontology(self, cypher_query: str, parameters: Dict[str, Any] = None,
+                       as_arrow: bool = False, as_df: bool = False) -> Union[List[Dict], pd.DataFrame, Any]:
+        """
+        Execute Cypher query on materialized ontology
+        Returns a pyarrow Table with as_arrow, a DataFrame with as_df,
+        and otherwise one dict per record
+        """
 
-    def query_ontology(self, cypher_query: str, parameters: Dict[str, Any] = None) -> List[Dict]:
-        """Execute Cypher query on materialized ontology"""
+        with self._pool.acquire() as conn:
+            result = conn.execute(cypher_query, parameters or {})
 
-        result = self.conn.execute(cypher_query, parameters or {})
-        return [dict(record) for record in result]
+            # Kuzu materializes columnar results natively; skip per-record boxing
+            if as_arrow:
+                return result.get_as_arrow()
+            if as_df:
+                return result.get_as_df()
+            # Records keep Kuzu's own values: None for missing properties and ints
+            # as ints, where a DataFrame round-trip would give NaN/NaT and floats
+            columns = result.get_column_names()
+            return [dict(zip(columns, row)) for row in result.get_all()]
 
     def get_ontology_statistics(self) -> Dict[str, int]:
         """Get statistics about materialized ontology"""
 
-        # Count concepts
-        concept_count = self.conn.execute("MATCH (c:OntologyConcept) RETURN count(c) as count")
-        concept_count = list(concept_count)[0]["count"]
-
-        # Count relationships
-        rel_count = self.conn.execute("MATCH ()-[r:OntologyRelationship]->() RETURN count(r) as count")
-        rel_count = list(rel_count)[0]["count"]
-
-        # Count by concept type
-        type_counts = {}
-        type_result = self.conn.execute("""
-            MATCH (c:OntologyConcept)
-            RETURN c.concept_type as type, count(c) as count
-        """)
-        for record in type_result:
-            type_counts[record["type"]] = record["count"]
+        with self._pool.acquire() as conn:
+            # Concept totals are summed from the per-type counts instead of a separate query
+            type_counts = {}
+            concept_count = 0
+            type_result = conn.execute("""
+                MATCH (c:OntologyConcept)
+                RETURN c.concept_type as type, count(c) as count
+            """)
+            while type_result.has_next():
+                concept_type, count = type_result.get_next()
+                type_counts[concept_type] = count
+                concept_count += count
+
+            # Count relationships
+            rel_result = conn.execute("MATCH ()-[r:OntologyRelationship]->() RETURN count(r) as count")
+            rel_count = rel_result.get_next()[0]
 
         return {
             "total_concepts": concept_count,
@@ -252,9 +548,88 @@ class OntologyMaterializer:
         }
 
 
-def load_ontology_from_file(file_path: str) -> Graph:
-    """Load RDF/OWL ontology from file"""
+def load_ontology_from_file(file_path: str, fast: bool = True) -> Graph:
+    """Load RDF/OWL ontology from file; fast parses with pyoxigraph when installed"""
 
     graph = Graph()
-    graph.parse(file_path)
-    return graph
\ No newline at end of file
+    if fast and _oxigraph_format(file_path) is not None:
+        graph.addN((subj, pred, obj, graph) for subj, pred, obj in _parse_with_oxigraph(file_path))
+    else:
+        graph.parse(file_path)
+    return graph
+
+
+def iter_ontology_triples(file_path: str) -> Iterator[Tuple[Any, Any, Any]]:
+    """Yield the triples of an RDF/OWL file as rdflib terms"""
+
+    if _oxigraph_format(file_path) is not None:
+        return _parse_with_oxigraph(file_path)
+    if Path(file_path).suffix.lower() == ".nt":
+        return _parse_ntriples(file_path)
+    return iter(load_ontology_from_file(file_path, fast=False))
+
+
+def _oxigraph_format(file_path: str):
+    """pyoxigraph format for a file, or None when rdflib has to parse it"""
+
+    if pyoxigraph is None:
+        return None
+    extension = Path(file_path).suffix.lstrip(".").lower()
+    # .owl files are RDF/XML in practice, as rdflib assumes
+    if extension == "owl":
+        return pyoxigraph.RdfFormat.RDF_XML
+    return pyoxigraph.RdfFormat.from_extension(extension)
+
+
+def _parse_with_oxigraph(file_path: str) -> Iterator[Tuple[Any, Any, Any]]:
+    """Parse a file with pyoxigraph's native parsers, converting terms to rdflib"""
+
+    # Same base IRI rdflib would use, so relative IRIs resolve identically; blank nodes
+    # are renamed so ids from separate files never collide, as with rdflib
+    base_iri = Path(file_path).resolve().as_uri()
+    triples = pyoxigraph.parse(path=file_path, format=_oxigraph_format(file_path),
+                               base_iri=base_iri, rename_blank_nodes=True)
+    for triple in triples:
+        yield (_to_rdflib_term(triple.subject), _to_rdflib_term(triple.predicate),
+               _to_rdflib_term(triple.object))
+
+
+class _TripleBuffer:
+    """rdflib parser sink that keeps triples until they are drained"""
+
+    def __init__(self):
+        self.triples = []
+
+    def triple(self, subj, pred, obj):
+        self.triples.append((subj, pred, obj))
+
+
+def _parse_ntriples(file_path: str) -> Iterator[Tuple[Any, Any, Any]]:
+    """Stream an N-Triples file through rdflib's parser a chunk of lines at a time"""
+
+    sink = _TripleBuffer()
+    parser = W3CNTriplesParser(sink)
+    # Shared across chunks so a blank node label means the same node file-wide
+    bnode_context = {}
+    with open(file_path, encoding="utf-8") as f:
+        while True:
+            lines = list(islice(f, _NTRIPLES_CHUNK_LINES))
+            if not lines:
+                return
+            parser.parsestring("".join(lines), bnode_context=bnode_context)
+            yield from sink.triples
+            sink.triples.clear()
+
+
+def _to_rdflib_term(term):
+    """Convert a pyoxigraph term to its rdflib counterpart"""
+
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    # rdflib leaves plain literals untyped where RDF 1.1 says xsd:string
+    datatype = term.datatype.value
+    return Literal(term.value, datatype=None if datatype == str(XSD.string) else URIRef(datatype))
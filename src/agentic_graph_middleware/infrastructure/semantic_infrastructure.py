@@ -5,10 +5,12 @@ Coordinates both KuzuDB and Jena Fuseki for comprehensive
 semantic graph operations and SPARQL endpoint services.
 """
 
+import os
 import subprocess
 import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -33,6 +35,16 @@ class SemanticInfrastructure:
         self.kuzu_materializer = None
         self.rdf_loader = None
 
+        # One keep-alive session for every Fuseki call instead of a handshake per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=3)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def close(self):
+        """Close pooled Fuseki connections"""
+        self._session.close()
+
     def initialize_kuzu(self) -> bool:
         """Initialize KuzuDB for high-performance graph operations"""
         try:
@@ -86,7 +98,7 @@ class SemanticInfrastructure:
 
         while time.time() - start_time < timeout:
             try:
-                response = requests.get(f"{self.fuseki_endpoint}/$/ping", timeout=2)
+                response = self._session.get(f"{self.fuseki_endpoint}/$/ping", timeout=2)
                 if response.status_code == 200:
                     logger.info("Fuseki is ready!")
                     return True
@@ -133,10 +145,6 @@ class SemanticInfrastructure:
 
     def _load_ontology_to_fuseki(self, ontology_path: str):
         """Load ontology file to Fuseki dataset"""
-        # Read ontology file
-        with open(ontology_path, 'r', encoding='utf-8') as f:
-            ontology_content = f.read()
-
         # Determine format
         if ontology_path.endswith('.owl') or ontology_path.endswith('.rdf'):
             content_type = 'application/rdf+xml'
@@ -147,11 +155,15 @@ class SemanticInfrastructure:
         else:
             content_type = 'application/rdf+xml'  # Default
 
-        # POST to Fuseki
+        # POST to Fuseki, streaming the file from disk rather than reading it into memory
         url = f"{self.fuseki_endpoint}/ontologies/data"
-        headers = {'Content-Type': content_type}
+        headers = {
+            'Content-Type': content_type,
+            'Content-Length': str(os.path.getsize(ontology_path))
+        }
 
-        response = requests.post(url, data=ontology_content, headers=headers)
+        with open(ontology_path, 'rb') as f:
+            response = self._session.post(url, data=f, headers=headers)
         response.raise_for_status()
 
     def query_kuzu(self, cypher_query: str, parameters: Dict[str, Any] = None) -> List[Dict]:
@@ -165,7 +177,7 @@ class SemanticInfrastructure:
         """Execute SPARQL query on Fuseki"""
         url = f"{self.fuseki_endpoint}/ontologies/sparql"
 
-        response = requests.post(
+        response = self._session.post(
             url,
             data={'query': sparql_query},
             headers={'Accept': 'application/json'}
@@ -193,12 +205,12 @@ class SemanticInfrastructure:
 
         # Check Fuseki
         try:
-            response = requests.get(f"{self.fuseki_endpoint}/$/ping", timeout=5)
+            response = self._session.get(f"{self.fuseki_endpoint}/$/ping", timeout=5)
             status["fuseki_ready"] = response.status_code == 200
 
             if status["fuseki_ready"]:
                 # Get dataset info
-                datasets_response = requests.get(f"{self.fuseki_endpoint}/$/datasets")
+                datasets_response = self._session.get(f"{self.fuseki_endpoint}/$/datasets")
                 if datasets_response.status_code == 200:
                     status["fuseki_stats"] = datasets_response.json()
 
@@ -216,7 +228,7 @@ class SemanticInfrastructure:
                 'dbType': 'tdb2'
             }
 
-            response = requests.post(url, data=data)
+            response = self._session.post(url, data=data)
             response.raise_for_status()
 
             logger.info(f"Created Fuseki dataset: {dataset_name}")
@@ -6,7 +6,12 @@ for high-performance graph operations and visualization.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Set
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from typing import Dict, List, Any, Optional, Set, Tuple
 from pathlib import Path
 from rdflib import Graph, Namespace, URIRef, Literal, BNode
 from rdflib.namespace import RDF, RDFS, OWL, SKOS, XSD
@@ -24,8 +29,33 @@ class RDFLoader:
     Handles standard ontology formats and namespaces
     """
 
-    def __init__(self, materializer: OntologyMaterializer):
+    # rdf:type objects that declare a concept, with the concept type each maps to;
+    # membership and type are one hash lookup instead of string comparisons
+    _CONCEPT_TYPES: Dict[URIRef, str] = {
+        OWL.Class: ConceptType.CLASS.value,
+        RDFS.Class: ConceptType.CLASS.value,
+        OWL.ObjectProperty: ConceptType.PROPERTY.value,
+        OWL.DatatypeProperty: ConceptType.PROPERTY.value,
+        OWL.AnnotationProperty: ConceptType.PROPERTY.value,
+        RDF.Property: ConceptType.PROPERTY.value,
+        OWL.NamedIndividual: ConceptType.INDIVIDUAL.value,
+        SKOS.Concept: ConceptType.CONCEPT.value,
+        SKOS.ConceptScheme: ConceptType.CONCEPT.value,
+    }
+
+    _RELATIONSHIP_TYPES: Dict[URIRef, str] = {
+        RDFS.subClassOf: RelationshipType.SUBCLASS.value,
+        RDFS.subPropertyOf: RelationshipType.SUBPROPERTY.value,
+        RDFS.domain: RelationshipType.DOMAIN.value,
+        RDFS.range: RelationshipType.RANGE.value,
+        OWL.inverseOf: RelationshipType.INVERSE.value,
+        RDFS.seeAlso: RelationshipType.REFERENCE.value,
+    }
+
+    def __init__(self, materializer: OntologyMaterializer, batch_size: int = 10_000):
         self.materializer = materializer
+        # Rows per UNWIND statement when writing concepts and relationships
+        self.batch_size = batch_size
         self.processed_uris: Set[str] = set()
 
     def load_ontology_file(self, file_path: str) -> Dict[str, int]:
@@ -34,109 +64,151 @@ class RDFLoader:
         Returns statistics about loaded concepts and relationships
         """
 
-        if not Path(file_path).exists():
-            raise FileNotFoundError(f"Ontology file not found: {file_path}")
-
-        logger.info(f"Loading ontology from {file_path}")
-
-        # Parse RDF graph
-        rdf_graph = Graph()
-        try:
-            rdf_graph.parse(file_path)
-        except Exception as e:
-            logger.error(f"Failed to parse ontology file {file_path}: {e}")
-            raise
-
-        logger.info(f"Parsed {len(rdf_graph)} triples from {file_path}")
-
         # Materialize into KuzuDB
-        return self._materialize_rdf_graph(rdf_graph)
+        return self._materialize_rdf_graph(_parse_ontology_file(file_path))
 
-    def load_multiple_ontologies(self, file_paths: List[str]) -> Dict[str, Any]:
+    def load_multiple_ontologies(self, file_paths: List[str],
+                                 max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Load multiple ontology files into single KuzuDB instance
+        Files are parsed in parallel worker processes; this process writes to KuzuDB
         Returns combined statistics
         """
 
         total_stats = {"total_concepts": 0, "total_relationships": 0, "files_loaded": []}
-
-        for file_path in file_paths:
-            try:
-                stats = self.load_ontology_file(file_path)
-                total_stats["total_concepts"] += stats.get("concepts_created", 0)
-                total_stats["total_relationships"] += stats.get("relationships_created", 0)
-                total_stats["files_loaded"].append({
-                    "file": file_path,
-                    "concepts": stats.get("concepts_created", 0),
-                    "relationships": stats.get("relationships_created", 0)
-                })
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
-                total_stats["files_loaded"].append({
-                    "file": file_path,
-                    "error": str(e)
-                })
+        if not file_paths:
+            return total_stats
+
+        # rdflib parsing is CPU-bound and holds the GIL, so each file is parsed and
+        # extracted in its own process. Results are written in file order, so the
+        # first file to declare a concept still wins, while later files keep parsing
+        with ExitStack() as stack:
+            if len(file_paths) > 1:
+                # Spawned, not forked: this process holds an open, multithreaded
+                # kuzu.Database that a forked child would inherit mid-operation
+                pool = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=max_workers or min(len(file_paths), os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context("spawn")
+                ))
+                extractions = [pool.submit(_parse_and_extract, file_path).result
+                               for file_path in file_paths]
+            else:
+                # A single file gains nothing from a worker process
+                extractions = [partial(_parse_and_extract, file_paths[0])]
+
+            for file_path, extraction in zip(file_paths, extractions):
+                try:
+                    stats = self._write_rows(*extraction())
+                    total_stats["total_concepts"] += stats.get("concepts_created", 0)
+                    total_stats["total_relationships"] += stats.get("relationships_created", 0)
+                    total_stats["files_loaded"].append({
+                        "file": file_path,
+                        "concepts": stats.get("concepts_created", 0),
+                        "relationships": stats.get("relationships_created", 0)
+                    })
+                except Exception as e:
+                    logger.error(f"Failed to load {file_path}: {e}")
+                    total_stats["files_loaded"].append({
+                        "file": file_path,
+                        "error": str(e)
+                    })
 
         return total_stats
 
     def _materialize_rdf_graph(self, rdf_graph: Graph) -> Dict[str, int]:
         """Materialize RDF graph into KuzuDB"""
 
-        concepts_created = 0
-        relationships_created = 0
+        return self._write_rows(*self._extract_rdf_graph(rdf_graph))
 
-        # Phase 1: Extract and create concept nodes
-        for subject, predicate, obj in rdf_graph:
-            if self._is_concept_declaration(predicate, obj):
-                if str(subject) not in self.processed_uris and not isinstance(subject, BNode):
-                    concept_data = self._extract_concept_data(rdf_graph, subject, predicate, obj)
+    @classmethod
+    def _extract_rdf_graph(cls, rdf_graph: Graph) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract concept rows and candidate relationship rows from an RDF graph
+        Needs no loader instance or database state, so it can run in a worker process
+        """
+
+        # Phase 1: Extract concept nodes, first declaration per subject. Only rdf:type
+        # triples are visited, answered from the store's predicate index
+        concepts = {}
+        for subject in rdf_graph.subjects(RDF.type, unique=True):
+            if isinstance(subject, BNode):
+                continue
+            for obj in rdf_graph.objects(subject, RDF.type):
+                if cls._is_concept_declaration(RDF.type, obj):
+                    concept_data = cls._extract_concept_data(rdf_graph, subject, RDF.type, obj)
                     if concept_data:
-                        self.materializer._create_ontology_concept(**concept_data)
-                        self.processed_uris.add(str(subject))
-                        concepts_created += 1
+                        concepts[str(subject)] = concept_data
+                        break
 
-        # Phase 2: Create relationships between concepts
+        # Phase 2: Extract relationships; endpoints are checked against every
+        # materialized concept when the rows are written
+        relationships = []
         for subject, predicate, obj in rdf_graph:
-            if not self._is_concept_declaration(predicate, obj) and not isinstance(subject, BNode) and not isinstance(obj, BNode):
-                relationship_data = self._extract_relationship_data(subject, predicate, obj)
-                if relationship_data and str(obj) in self.processed_uris:
-                    try:
-                        self.materializer._create_ontology_relationship(**relationship_data)
-                        relationships_created += 1
-                    except Exception as e:
-                        # Skip relationships where target concept doesn't exist
-                        logger.debug(f"Skipped relationship {predicate}: {e}")
+            # Literal objects (labels, comments, values) and blank nodes can never satisfy
+            # the concept MATCH, so drop them before any lookup or query
+            if isinstance(obj, (Literal, BNode)) or isinstance(subject, BNode):
+                continue
+            if not cls._is_concept_declaration(predicate, obj):
+                relationship_data = cls._extract_relationship_data(subject, predicate, obj)
+                if relationship_data:
+                    relationships.append(relationship_data)
+
+        return list(concepts.values()), relationships
+
+    def _write_rows(self, concept_rows: List[Dict[str, Any]],
+                    relationship_rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Create extracted concepts and relationships in KuzuDB"""
+
+        # Every row of this graph shares one creation timestamp
+        now = datetime.now()
+
+        concepts = {}
+        for concept_data in concept_rows:
+            if concept_data["uri"] not in self.processed_uris and concept_data["uri"] not in concepts:
+                concepts[concept_data["uri"]] = {
+                    **concept_data,
+                    "description": concept_data["description"] or "",
+                    "namespace": concept_data["namespace"] or "",
+                    "timestamp": now
+                }
+
+        # One UNWIND statement per batch instead of a query per row. Each batch is
+        # recorded once written, so a later failure never causes a re-CREATE of it
+        concept_batch = list(concepts.values())
+        for start in range(0, len(concept_batch), self.batch_size):
+            batch = concept_batch[start:start + self.batch_size]
+            self.materializer._create_ontology_concepts(batch)
+            self.processed_uris.update(row["uri"] for row in batch)
+
+        # Both endpoints are materialized concepts, so every row's MATCH succeeds
+        relationships = [
+            {**relationship_data, "timestamp": now}
+            for relationship_data in relationship_rows
+            if relationship_data["subject_uri"] in self.processed_uris
+            and relationship_data["object_uri"] in self.processed_uris
+        ]
+        for start in range(0, len(relationships), self.batch_size):
+            self.materializer._create_ontology_relationships(relationships[start:start + self.batch_size])
 
         return {
-            "concepts_created": concepts_created,
-            "relationships_created": relationships_created
+            "concepts_created": len(concepts),
+            "relationships_created": len(relationships)
         }
 
-    def _is_concept_declaration(self, predicate: URIRef, obj: URIRef) -> bool:
+    @classmethod
+    def _is_concept_declaration(cls, predicate: URIRef, obj: URIRef) -> bool:
         """Check if this triple declares a concept"""
-        if predicate != RDF.type:
-            return False
-
-        return str(obj) in [
-            str(OWL.Class),
-            str(OWL.ObjectProperty),
-            str(OWL.DatatypeProperty),
-            str(OWL.AnnotationProperty),
-            str(OWL.NamedIndividual),
-            str(RDFS.Class),
-            str(RDF.Property),
-            str(SKOS.Concept),
-            str(SKOS.ConceptScheme)
-        ]
+        return predicate == RDF.type and obj in cls._CONCEPT_TYPES
 
-    def _extract_concept_data(self, graph: Graph, subject: URIRef, predicate: URIRef, obj: URIRef) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def _extract_concept_data(cls, graph: Graph, subject: URIRef, predicate: URIRef, obj: URIRef) -> Optional[Dict[str, Any]]:
         """Extract concept data for KuzuDB storage"""
 
         uri = str(subject)
-        concept_type = self._determine_concept_type(obj)
-        label = self._extract_label(graph, subject)
-        description = self._extract_description(graph, subject)
-        namespace = self._extract_namespace(subject)
+        concept_type = cls._determine_concept_type(obj)
+        label = cls._extract_label(graph, subject)
+        description = cls._extract_description(graph, subject)
+        namespace = cls._extract_namespace(subject)
 
         return {
             "uri": uri,
@@ -146,7 +218,8 @@ class RDFLoader:
             "namespace": namespace
         }
 
-    def _extract_relationship_data(self, subject: URIRef, predicate: URIRef, obj: URIRef) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def _extract_relationship_data(cls, subject: URIRef, predicate: URIRef, obj: URIRef) -> Optional[Dict[str, Any]]:
         """Extract relationship data for KuzuDB storage"""
 
         # Skip literal objects for now (focusing on concept-to-concept relationships)
@@ -156,7 +229,7 @@ class RDFLoader:
         subject_uri = str(subject)
         object_uri = str(obj)
         predicate_uri = str(predicate)
-        relationship_type = self._determine_relationship_type(predicate)
+        relationship_type = cls._determine_relationship_type(predicate)
 
         return {
             "subject_uri": subject_uri,
@@ -165,48 +238,28 @@ class RDFLoader:
             "relationship_type": relationship_type
         }
 
-    def _determine_concept_type(self, rdf_type: URIRef) -> str:
+    @classmethod
+    def _determine_concept_type(cls, rdf_type: URIRef) -> str:
         """Determine concept type from RDF type"""
-        type_str = str(rdf_type)
-
-        if str(OWL.Class) in type_str or str(RDFS.Class) in type_str:
-            return ConceptType.CLASS.value
-        elif "Property" in type_str:
-            return ConceptType.PROPERTY.value
-        elif str(OWL.NamedIndividual) in type_str:
-            return ConceptType.INDIVIDUAL.value
-        else:
-            return ConceptType.CONCEPT.value
+        return cls._CONCEPT_TYPES.get(rdf_type, ConceptType.CONCEPT.value)
 
-    def _determine_relationship_type(self, predicate: URIRef) -> str:
+    @classmethod
+    def _determine_relationship_type(cls, predicate: URIRef) -> str:
         """Determine relationship type from predicate"""
-        pred_str = str(predicate)
-
-        if str(RDFS.subClassOf) in pred_str:
-            return RelationshipType.SUBCLASS.value
-        elif str(RDFS.subPropertyOf) in pred_str:
-            return RelationshipType.SUBPROPERTY.value
-        elif str(RDFS.domain) in pred_str:
-            return RelationshipType.DOMAIN.value
-        elif str(RDFS.range) in pred_str:
-            return RelationshipType.RANGE.value
-        elif str(OWL.inverseOf) in pred_str:
-            return RelationshipType.INVERSE.value
-        elif str(RDFS.seeAlso) in pred_str:
-            return RelationshipType.REFERENCE.value
-        else:
-            return RelationshipType.SEMANTIC_RELATION.value
+        return cls._RELATIONSHIP_TYPES.get(predicate, RelationshipType.SEMANTIC_RELATION.value)
 
-    def _extract_label(self, graph: Graph, uri: URIRef) -> str:
+    @classmethod
+    def _extract_label(cls, graph: Graph, uri: URIRef) -> str:
         """Extract human-readable label"""
         for label in graph.objects(uri, RDFS.label):
             return str(label)
         for label in graph.objects(uri, SKOS.prefLabel):
             return str(label)
         # Fallback to local name
-        return self._get_local_name(uri)
+        return cls._get_local_name(uri)
 
-    def _extract_description(self, graph: Graph, uri: URIRef) -> Optional[str]:
+    @classmethod
+    def _extract_description(cls, graph: Graph, uri: URIRef) -> Optional[str]:
         """Extract description/comment"""
         for desc in graph.objects(uri, RDFS.comment):
             return str(desc)
@@ -216,18 +269,47 @@ class RDFLoader:
             return str(desc)
         return None
 
-    def _extract_namespace(self, uri: URIRef) -> str:
+    @classmethod
+    def _extract_namespace(cls, uri: URIRef) -> str:
         """Extract namespace from URI"""
         uri_str = str(uri)
         if "#" in uri_str:
-            return uri_str.split("#")[0] + "#"
+            return uri_str.partition("#")[0] + "#"
         else:
-            return "/".join(uri_str.split("/")[:-1]) + "/"
+            return uri_str.rpartition("/")[0] + "/"
 
-    def _get_local_name(self, uri: URIRef) -> str:
+    @classmethod
+    def _get_local_name(cls, uri: URIRef) -> str:
         """Get local name from URI"""
         uri_str = str(uri)
         if "#" in uri_str:
-            return uri_str.split("#")[-1]
+            return uri_str.rpartition("#")[2]
         else:
-            return uri_str.split("/")[-1]
\ No newline at end of file
+            return uri_str.rpartition("/")[2]
+
+
+def _parse_ontology_file(file_path: str) -> Graph:
+    """Parse an RDF/OWL file into an rdflib Graph"""
+
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"Ontology file not found: {file_path}")
+
+    logger.info(f"Loading ontology from {file_path}")
+
+    # Parse RDF graph
+    rdf_graph = Graph()
+    try:
+        rdf_graph.parse(file_path)
+    except Exception as e:
+        logger.error(f"Failed to parse ontology file {file_path}: {e}")
+        raise
+
+    logger.info(f"Parsed {len(rdf_graph)} triples from {file_path}")
+    return rdf_graph
+
+
+def _parse_and_extract(file_path: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Parse a file and extract its rows; the worker-process side of load_multiple_ontologies"""
+
+    # Extraction is a classmethod, so workers need no loader or KuzuDB connection
+    return RDFLoader._extract_rdf_graph(_parse_ontology_file(file_path))
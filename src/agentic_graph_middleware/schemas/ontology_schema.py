@@ -17,6 +17,7 @@ class ConceptType(Enum):
     PROPERTY = "property"
     INDIVIDUAL = "individual"
     CONCEPT = "concept"
+    EXTERNAL = "external"
 
 
 class RelationshipType(Enum):
@@ -0,0 +1,254 @@
+"""
+Ontology Loader for the Marimo Explorers
+Fuseki queries, namespace classification and graph caching shared by the
+yFiles, Plotly and Graphistry explorer notebooks
+"""
+
+import csv
+import hashlib
+import io
+import pickle
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import pandas as pd
+
+try:
+    import ijson
+except ImportError:  # optional; without it bindings are parsed once the response is complete
+    ijson = None
+
+
+CLASSES_QUERY = """
+PREFIX owl: <http://www.w3.org/2002/07/owl#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+SELECT DISTINCT ?class ?label ?comment
+WHERE {
+  ?class a owl:Class .
+  OPTIONAL { ?class rdfs:label ?label }
+  OPTIONAL { ?class rdfs:comment ?comment }
+}
+ORDER BY ?class ?label ?comment
+"""
+
+RELATIONSHIPS_QUERY = """
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+PREFIX owl: <http://www.w3.org/2002/07/owl#>
+
+SELECT DISTINCT ?subject ?predicate ?object
+WHERE {
+  {
+    ?subject rdfs:subClassOf ?object .
+    BIND(rdfs:subClassOf as ?predicate)
+  } UNION {
+    ?subject owl:equivalentClass ?object .
+    BIND(owl:equivalentClass as ?predicate)
+  } UNION {
+    ?subject rdfs:seeAlso ?object .
+    BIND(rdfs:seeAlso as ?predicate)
+  }
+  FILTER(isURI(?object))
+}
+ORDER BY ?subject ?predicate ?object
+"""
+
+# Loaded graphs are pickled here; the three explorers share the directory
+CACHE_DIR = Path('.cache') / 'ontology_explorer'
+
+# Local-name keyword sets compiled once into single-pass alternations
+_DBC_RE = re.compile('databusinesscanvas|customersegment|valueproposition|revenuestream|'
+                     'coststructure|dataasset|intelligencecapability')
+_BRIDGE_RE = re.compile('channel|customerrelationship|keyresource|keyactivity|keypartner|'
+                        'dataproduct|dataservice|executivetarget')
+_SOW_RE = re.compile('semanticsowcontract')
+
+# Namespace rules in priority order: (namespace, URI keyword, local-name pattern)
+NAMESPACE_RULES = (
+    ('dbc', None, _DBC_RE),
+    ('bridge', 'bridge', _BRIDGE_RE),
+    ('sow', 'sow', _SOW_RE),
+    ('gist', 'gist', None),
+    ('owl', 'owl', None),
+    ('rdf', 'rdf', None),
+)
+
+_TSV_ESCAPES = {'t': '\t', 'n': '\n', 'r': '\r'}
+
+
+class FusekiSPARQLClient:
+    """Keep-alive SPARQL client for a single Fuseki dataset"""
+
+    def __init__(
+        self,
+        fuseki_url: str = "http://localhost:3030",
+        dataset: str = "ontologies",
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: float = 30.0
+    ):
+        # One pooled client for every SPARQL call instead of a handshake per query
+        self.client = httpx.Client(
+            auth=auth,
+            base_url=f"{fuseki_url.rstrip('/')}/{dataset}",
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        )
+
+    def close(self):
+        """Close pooled connections"""
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def query(self, query: str) -> List[Dict[str, Any]]:
+        """Execute SPARQL query, returning the JSON result bindings"""
+        response = self.client.post(
+            "/sparql",
+            data={'query': query},
+            headers={'Accept': 'application/sparql-results+json'}
+        )
+        response.raise_for_status()
+        return response.json()['results']['bindings']
+
+    def stream(self, query: str) -> Iterator[Dict[str, Any]]:
+        """Execute SPARQL query, yielding bindings as the response is parsed"""
+        if ijson is None:
+            yield from self.query(query)
+            return
+
+        bindings = ijson.sendable_list()
+        parser = ijson.items_coro(bindings, 'results.bindings.item')
+        with self.client.stream(
+            "POST",
+            "/sparql",
+            data={'query': query},
+            headers={'Accept': 'application/sparql-results+json'}
+        ) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                yield from bindings
+                del bindings[:]
+        parser.close()
+        yield from bindings
+
+    def paginate(self, query: str, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream every binding of a query, fetching one LIMIT/OFFSET page at a time
+
+        The query must have an ORDER BY over all of its variables; SPARQL
+        gives no stable row order otherwise, so pages could overlap or skip rows.
+        """
+        if not re.search(r'\bORDER\s+BY\b', query, re.IGNORECASE):
+            raise ValueError("paginate() requires a query with an ORDER BY clause")
+
+        offset = 0
+        while True:
+            rows = 0
+            for binding in self.stream(f"{query} LIMIT {page_size} OFFSET {offset}"):
+                rows += 1
+                yield binding
+            # A short page is the last one; no need to ask for an empty page
+            if rows < page_size:
+                return
+            offset += page_size
+
+    def query_frame(self, query: str) -> pd.DataFrame:
+        """Execute SPARQL query as TSV, returning one column per variable"""
+        response = self.client.post(
+            "/sparql",
+            data={'query': query},
+            headers={'Accept': 'text/tab-separated-values'}
+        )
+        response.raise_for_status()
+        results = pd.read_csv(io.StringIO(response.text), sep='\t', quoting=csv.QUOTE_NONE,
+                              dtype=str, keep_default_na=False, na_values=[''])
+        results.columns = results.columns.str.lstrip('?')
+        return results.apply(_decode_terms)
+
+
+def _decode_terms(terms: pd.Series) -> pd.Series:
+    """Turn a column of TSV-encoded RDF terms into plain values"""
+    is_uri = terms.str.startswith('<', na=False)
+    literals = (terms
+                .str.extract(r'^"(.*)"(?:@[\w-]+|\^\^<[^>]*>)?$', expand=False)
+                .str.replace(r'\\(.)', lambda m: _TSV_ESCAPES.get(m.group(1), m.group(1)), regex=True))
+    return terms.str.slice(1, -1).where(is_uri, literals.fillna(terms))
+
+
+# URIs recur across classes and relationship endpoints, so memoize per URI
+@lru_cache(maxsize=4096)
+def get_namespace(uri: str, local_name: str) -> str:
+    """Determine ontology namespace"""
+    uri_lower = uri.lower()
+    local_lower = local_name.lower()
+
+    for namespace, uri_keyword, local_pattern in NAMESPACE_RULES:
+        if uri_keyword and uri_keyword in uri_lower:
+            return namespace
+        if local_pattern and local_pattern.search(local_lower):
+            return namespace
+    return 'unknown'
+
+
+@lru_cache(maxsize=4096)
+def get_local_name(uri: str) -> str:
+    """Extract local name from URI"""
+    if '#' in uri:
+        return uri.split('#')[-1]
+    elif '/' in uri:
+        return uri.split('/')[-1]
+    return uri
+
+
+def get_local_names(uris: pd.Series) -> pd.Series:
+    """Vectorized get_local_name over a Series of URIs"""
+    after_hash = uris.str.rsplit('#', n=1).str[-1]
+    after_slash = uris.str.rsplit('/', n=1).str[-1]
+    return after_hash.where(uris.str.contains('#', regex=False), after_slash)
+
+
+def get_namespaces(uris: pd.Series, local_names: pd.Series) -> pd.Series:
+    """Vectorized get_namespace over Series of URIs and local names"""
+    uri_lower = uris.str.lower()
+    local_lower = local_names.str.lower()
+
+    # Lowest priority first: later rules overwrite, mirroring get_namespace's rule order
+    namespaces = pd.Series('unknown', index=uris.index, dtype=object)
+    for name, uri_keyword, local_pattern in reversed(NAMESPACE_RULES):
+        mask = pd.Series(False, index=uris.index)
+        if uri_keyword:
+            mask |= uri_lower.str.contains(uri_keyword, regex=False)
+        if local_pattern:
+            mask |= local_lower.str.contains(local_pattern)
+        namespaces = namespaces.mask(mask, name)
+    return namespaces
+
+
+def clear_cache():
+    """Drop every cached ontology load"""
+    for path in CACHE_DIR.glob('*.pkl'):
+        path.unlink(missing_ok=True)
+
+
+def cached_load(name: str, key: Tuple, build: Callable[[], Any]) -> Any:
+    """Return build()'s result, pickled to disk under a hash of key"""
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+    path = CACHE_DIR / f"{name}-{digest}.pkl"
+    if path.exists():
+        with path.open('rb') as f:
+            return pickle.load(f)
+
+    result = build()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with tmp_path.open('wb') as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
+    return result